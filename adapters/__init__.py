@@ -40,6 +40,7 @@ from adapters.base_adapter import (
     Position,
     Balance,
     Order,
+    Snapshot,
 )
 from adapters.factory import (
     create_adapter,
@@ -56,6 +57,7 @@ __all__ = [
     "Position",
     "Balance",
     "Order",
+    "Snapshot",
     
     # 枚举
     "OrderSide",
@@ -5,12 +5,23 @@ This module provides a base adapter interface for integrating different
 perpetual futures exchanges. All exchange-specific adapters should inherit
 from BasePerpAdapter and implement the required methods.
 """
+import threading
 from abc import ABC, abstractmethod
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from decimal import Decimal
 from enum import Enum
 
 
+# 账户/行情快照：ticker 为字典，balance/open_orders/position 为对应数据模型
+Snapshot = namedtuple("Snapshot", ["ticker", "balance", "open_orders", "position"])
+
+# 快照查询共享的线程池：按快照周期反复新建/销毁线程池开销不小，
+# 这里全局复用一个守护线程池
+_SNAPSHOT_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="snapshot")
+
+
 class OrderSide(Enum):
     """订单方向"""
     BUY = "buy"
@@ -446,6 +457,193 @@ class BasePerpAdapter(ABC):
             **kwargs
         )
     
+    def snapshot(self, symbol: str, include_orders: bool = True,
+                 include_position: bool = True, include_ticker: bool = True) -> Snapshot:
+        """
+        并发拉取行情、余额、挂单、持仓快照（便捷方法）
+
+        四个查询互相独立，用线程池并发发出，整体耗时从
+        各请求耗时之和降为最慢一个请求的耗时。
+
+        Args:
+            symbol: 交易对符号
+            include_orders: 是否查询挂单；调用方自己缓存挂单时可设为
+                False 跳过该请求，此时 open_orders 为 None
+            include_position: 是否查询持仓；调用方能确定当前不可能有
+                持仓时可设为 False 跳过该请求，此时 position 为 None
+            include_ticker: 是否查询行情；调用方已有足够新的行情
+                （如 WS/轮询推送）时可设为 False，此时 ticker 为 None
+
+        Returns:
+            Snapshot: (ticker, balance, open_orders, position) 命名元组
+
+        Raises:
+            Exception: 任意一个查询失败时抛出异常
+        """
+        executor = _SNAPSHOT_EXECUTOR
+        ticker_future = executor.submit(self.get_ticker, symbol) if include_ticker else None
+        balance_future = executor.submit(self.get_balance)
+        orders_future = executor.submit(self.get_open_orders, symbol=symbol) if include_orders else None
+        position_future = executor.submit(self.get_position, symbol) if include_position else None
+
+        return Snapshot(
+            ticker=ticker_future.result() if ticker_future else None,
+            balance=balance_future.result(),
+            open_orders=orders_future.result() if orders_future else None,
+            position=position_future.result() if position_future else None,
+        )
+
+    def subscribe_ticker(self, symbol: str, callback, poll_interval: float = 1.0) -> threading.Event:
+        """
+        订阅行情更新（便捷方法）
+
+        基类实现用后台守护线程轮询 get_ticker，每次成功后调用
+        callback(ticker)。支持 WebSocket 行情推送的交易所可以覆盖
+        本方法，保持相同的回调接口。
+
+        Args:
+            symbol: 交易对符号
+            callback: 回调函数，入参为 get_ticker 的返回值
+            poll_interval: 轮询间隔（秒）
+
+        Returns:
+            threading.Event: 停止事件，set() 后后台线程退出
+        """
+        stop_event = threading.Event()
+
+        def _poll():
+            while not stop_event.is_set():
+                try:
+                    callback(self.get_ticker(symbol))
+                except Exception:
+                    # 行情抖动不应终止订阅线程
+                    pass
+                stop_event.wait(poll_interval)
+
+        thread = threading.Thread(target=_poll, name=f"ticker-{symbol}", daemon=True)
+        thread.start()
+        return stop_event
+
+    def place_order_ws(self, *args, **kwargs) -> Order:
+        """
+        通过 WebSocket 下单（可选能力）
+
+        支持 WS 交易通道的交易所适配器可以覆盖本方法，省去每笔订单的
+        HTTP 请求开销。基类直接回退到 REST place_order，因此调用方
+        无需区分适配器能力。参数与 place_order 完全一致。
+        """
+        return self.place_order(*args, **kwargs)
+
+    def cancel_order_ws(self, *args, **kwargs) -> bool:
+        """
+        通过 WebSocket 撤单（可选能力）
+
+        同 place_order_ws：基类回退到 REST cancel_order，
+        参数与 cancel_order 完全一致。
+        """
+        return self.cancel_order(*args, **kwargs)
+
+    def batch_place_orders(self, orders: List[Dict[str, Any]]) -> List[Order]:
+        """
+        批量下单（便捷方法）
+
+        支持原生批量下单端点的交易所适配器可以覆盖本方法，一次请求
+        提交全部订单。基类用共享线程池并发逐笔下单，墙上时间为最慢
+        一笔的耗时；任意一笔失败时抛出该笔的异常。
+
+        Args:
+            orders: 订单参数字典列表，每个字典为 place_order 的关键字参数
+
+        Returns:
+            List[Order]: 与入参顺序一致的订单信息列表
+        """
+        futures = [_SNAPSHOT_EXECUTOR.submit(self.place_order, **order) for order in orders]
+        return [future.result() for future in futures]
+
+    def batch_cancel_orders(self, order_ids: List[str], symbol: Optional[str] = None) -> List[bool]:
+        """
+        批量撤单（便捷方法）
+
+        同 batch_place_orders：基类并发逐笔撤单，支持原生批量撤单
+        端点的交易所可以覆盖。
+
+        Args:
+            order_ids: 订单ID列表
+            symbol: 交易对符号（某些交易所需要）
+
+        Returns:
+            List[bool]: 与入参顺序一致的撤单结果列表
+        """
+        futures = [_SNAPSHOT_EXECUTOR.submit(self.cancel_order, order_id=order_id, symbol=symbol)
+                   for order_id in order_ids]
+        return [future.result() for future in futures]
+
+    def amend_order(
+        self,
+        order_id: str,
+        symbol: str,
+        side: str,
+        quantity: Decimal,
+        price: Decimal,
+        time_in_force: str = "gtc",
+        reduce_only: bool = False,
+        **kwargs
+    ) -> Order:
+        """
+        修改订单价格/数量（便捷方法）
+
+        支持原生 amend/modify 端点的交易所适配器可以覆盖本方法，
+        一次往返完成改价。基类用撤单+重下模拟，语义一致但存在
+        短暂的无挂单窗口。
+
+        Args:
+            order_id: 要修改的订单ID
+            symbol: 交易对符号
+            side: 订单方向
+            quantity: 新的订单数量
+            price: 新的订单价格
+            time_in_force: 订单有效期
+            reduce_only: 是否只减仓
+            **kwargs: 其他交易所特定参数
+
+        Returns:
+            Order: 修改后的订单信息
+
+        Raises:
+            Exception: 修改失败时抛出异常
+        """
+        self.cancel_order(order_id=order_id, symbol=symbol)
+        return self.place_order(
+            symbol=symbol,
+            side=side,
+            order_type="limit",
+            quantity=quantity,
+            price=price,
+            time_in_force=time_in_force,
+            reduce_only=reduce_only,
+            **kwargs
+        )
+
+    def subscribe_user_orders(self, callback) -> threading.Event:
+        """
+        订阅用户订单事件（可选能力）
+
+        支持用户数据推送（WebSocket user stream 等）的交易所适配器可以
+        覆盖本方法，在订单成交/撤销时调用 callback(event)。基类不提供
+        轮询兜底：调用方应捕获 NotImplementedError 并退回已有的
+        持仓/订单检查路径。
+
+        Args:
+            callback: 回调函数，入参为交易所的订单事件
+
+        Returns:
+            threading.Event: 停止事件，set() 后推送停止
+
+        Raises:
+            NotImplementedError: 适配器未提供订单事件推送时
+        """
+        raise NotImplementedError("该适配器不支持订单事件推送")
+
     def get_position(self, symbol: str) -> Optional[Position]:
         """
         获取单个交易对的持仓（便捷方法）
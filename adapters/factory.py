@@ -21,6 +21,9 @@ try:
 except ImportError:
     pass  # pysdk not installed, skip GRVT adapter
 
+# 已创建的适配器实例缓存（按交易所 + 配置内容）
+_ADAPTER_CACHE: Dict[Any, BasePerpAdapter] = {}
+
 
 def create_adapter(config: Dict[str, Any]) -> BasePerpAdapter:
     """
@@ -59,12 +62,26 @@ def create_adapter(config: Dict[str, Any]) -> BasePerpAdapter:
         )
     
     adapter_class = _ADAPTER_REGISTRY[exchange_name]
-    
+
+    # 相同配置复用已创建的实例（适配器初始化涉及私钥推导等较重操作）
     try:
-        return adapter_class(config)
+        cache_key = (exchange_name, tuple(sorted(config.items())))
+        hash(cache_key)  # 提前探测：值不可哈希时 sorted 不会报错，hash 才会
+    except TypeError:
+        cache_key = None  # 配置包含不可哈希的值，退回每次新建
+
+    if cache_key is not None and cache_key in _ADAPTER_CACHE:
+        return _ADAPTER_CACHE[cache_key]
+
+    try:
+        adapter = adapter_class(config)
     except Exception as e:
         raise ValueError(f"创建适配器失败: {e}")
 
+    if cache_key is not None:
+        _ADAPTER_CACHE[cache_key] = adapter
+    return adapter
+
 
 def register_adapter(exchange_name: str, adapter_class: Type[BasePerpAdapter]):
     """
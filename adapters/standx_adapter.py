@@ -25,7 +25,6 @@ from exchange.exchange_standx.standx_protocol.perps_auth import StandXAuth
 from exchange.exchange_standx.standx_protocol.perp_http import StandXPerpHTTP
 from eth_account.messages import encode_defunct
 from eth_account import Account
-from web3 import Web3
 
 
 class StandXAdapter(BasePerpAdapter):
@@ -41,6 +40,7 @@ class StandXAdapter(BasePerpAdapter):
                 - private_key: 钱包私钥（可选，优先使用环境变量 STANDX_PRIVATE_KEY）
                 - chain: 链名称，如 "bsc" 或 "solana"（可选，优先使用环境变量 STANDX_CHAIN）
                 - base_url: API 基础 URL（可选，默认 https://perps.standx.com）
+                - pool_connections / pool_maxsize: HTTP 连接池大小（可选）
 
         环境变量优先级高于配置字典，推荐使用环境变量存储私钥
         """
@@ -58,29 +58,28 @@ class StandXAdapter(BasePerpAdapter):
         self.chain = os.environ.get("STANDX_CHAIN") or config.get("chain", "bsc")
         base_url = config.get("base_url", "https://perps.standx.com")
         
-        # 初始化客户端
+        # 初始化客户端（长连接会话在 StandXPerpHTTP 内部维护）
         self.auth = StandXAuth()
-        self.http_client = StandXPerpHTTP(base_url=base_url)
+        self.http_client = StandXPerpHTTP(
+            base_url=base_url,
+            pool_connections=config.get("pool_connections", 4),
+            pool_maxsize=config.get("pool_maxsize", 16),
+        )
         
-        # 获取钱包地址
+        # 私钥推导只做一次：缓存 LocalAccount，地址和签名都复用它
         if self.private_key.startswith('0x'):
             private_key = self.private_key[2:]
         else:
             private_key = self.private_key
-        
-        account = Web3().eth.account.from_key(private_key)
-        self.wallet_address = account.address
+
+        self._account = Account.from_key(private_key)
+        self.wallet_address = self._account.address
         self.token: Optional[str] = None
-    
+
     def _sign_message(self, message: str) -> str:
         """签名消息"""
-        private_key = self.private_key
-        if private_key.startswith('0x'):
-            private_key = private_key[2:]
-        
-        account = Account.from_key(private_key)
         message_encoded = encode_defunct(text=message)
-        signed = account.sign_message(message_encoded)
+        signed = self._account.sign_message(message_encoded)
         return "0x" + signed.signature.hex()
     
     def connect(self) -> bool:
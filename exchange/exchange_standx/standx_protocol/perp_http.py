@@ -3,6 +3,7 @@ StandX Perps HTTP API Client
 """
 from typing import Dict, Any, Optional, List
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import json
 import time
 import uuid
@@ -18,16 +19,29 @@ class RegionResponse:
 class StandXPerpHTTP:
     """StandX Perps HTTP API Client"""
     
-    def __init__(self, base_url: str = "https://perps.standx.com", geo_url: str = "https://geo.standx.com"):
+    def __init__(self, base_url: str = "https://perps.standx.com", geo_url: str = "https://geo.standx.com",
+                 pool_connections: int = 4, pool_maxsize: int = 16):
         """
         Initialize StandX Perps HTTP client.
-        
+
         Args:
             base_url: Base URL for perps API (default: https://perps.standx.com)
             geo_url: Base URL for geo API (default: https://geo.standx.com)
+            pool_connections: Number of connection pools to keep
+            pool_maxsize: Max keep-alive connections per pool
         """
         self.base_url = base_url.rstrip('/')
         self.geo_url = geo_url.rstrip('/')
+
+        # 复用连接池 + keep-alive，避免每个请求重新做 TCP/TLS 握手
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=2, backoff_factor=0.1),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
     def health_check(self) -> str:
         """
@@ -40,7 +54,7 @@ class StandXPerpHTTP:
             ValueError: If request fails
         """
         url = f"{self.base_url}/api/health"
-        response = requests.get(url)
+        response = self.session.get(url)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -59,7 +73,7 @@ class StandXPerpHTTP:
         """
         url = f"{self.geo_url}/v1/region"
         # 增加超时时间，防止网络问题导致长时间阻塞
-        response = requests.get(url, timeout=1.0)
+        response = self.session.get(url, timeout=1.0)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -116,7 +130,7 @@ class StandXPerpHTTP:
             "Authorization": f"Bearer {token}"
         }
         
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -203,7 +217,7 @@ class StandXPerpHTTP:
         sign_headers = auth.sign_request(payload_str, request_id, timestamp)
         headers.update(sign_headers)
         
-        response = requests.post(url, headers=headers, data=payload_str)
+        response = self.session.post(url, headers=headers, data=payload_str)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -247,7 +261,7 @@ class StandXPerpHTTP:
         if symbol:
             params["symbol"] = symbol
         
-        response = requests.get(url, headers=headers, params=params)
+        response = self.session.get(url, headers=headers, params=params)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -283,7 +297,7 @@ class StandXPerpHTTP:
         url = f"{self.base_url}/api/query_symbol_price"
         params = {"symbol": symbol}
         
-        response = requests.get(url, params=params)
+        response = self.session.get(url, params=params)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -324,7 +338,7 @@ class StandXPerpHTTP:
         if limit:
             params["limit"] = limit
         
-        response = requests.get(url, headers=headers, params=params)
+        response = self.session.get(url, headers=headers, params=params)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -380,7 +394,7 @@ class StandXPerpHTTP:
         sign_headers = auth.sign_request(payload_str, request_id, timestamp)
         headers.update(sign_headers)
 
-        response = requests.post(url, headers=headers, data=payload_str)
+        response = self.session.post(url, headers=headers, data=payload_str)
 
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -430,7 +444,7 @@ class StandXPerpHTTP:
         sign_headers = auth.sign_request(payload_str, request_id, timestamp)
         headers.update(sign_headers)
 
-        response = requests.post(url, headers=headers, data=payload_str)
+        response = self.session.post(url, headers=headers, data=payload_str)
 
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
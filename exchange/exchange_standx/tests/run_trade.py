@@ -14,23 +14,86 @@ StandX 交易脚本
 """
 import sys
 import os
+import json
 import argparse
+import functools
 
 # 添加项目路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-# 加载 .env 文件（如果存在）
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+
+def _load_env_cached():
+    """加载 .env 文件（带 mtime 缓存）
+
+    .env 未变化时直接读取 .env.cache.json 快照，跳过 dotenv 的逐行解析；
+    变化时用 dotenv_values 重新解析并刷新快照。
+    """
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+    env_path = os.path.join(project_root, '.env')
+    if not os.path.exists(env_path):
+        return
+
+    cache_path = os.path.join(project_root, '.env.cache.json')
+    mtime = os.path.getmtime(env_path)
+
+    # 命中缓存：直接回放快照（与 load_dotenv 一致，不覆盖已有环境变量）
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('mtime') == mtime:
+            for k, v in cached.get('vars', {}).items():
+                os.environ.setdefault(k, v)
+            return
+    except (OSError, ValueError):
+        pass
+
+    # 缓存失效：解析一次并写回快照
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        return
+
+    env_vars = {k: v for k, v in dotenv_values(env_path).items() if v is not None}
+    for k, v in env_vars.items():
+        os.environ.setdefault(k, v)
+
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'mtime': mtime, 'vars': env_vars}, f)
+    except OSError:
+        pass
+
+
+_load_env_cached()
+
+# 环境变量快照：os.environ 每次访问都要经过代理对象，
+# 这里在 load_dotenv 之后做一次快照，之后直接读普通 dict
+_ENV_CACHE = {}
+
+
+def _refresh_env_cache():
+    """刷新环境变量快照（仅在 load_dotenv 之后需要调用一次）"""
+    _ENV_CACHE.update(
+        {k: os.environ[k] for k in ("STANDX_PRIVATE_KEY", "STANDX_CHAIN") if k in os.environ}
+    )
+
+
+_refresh_env_cache()
 
 from standx_protocol.perps_auth import StandXAuth
 from standx_protocol.perp_http import StandXPerpHTTP
-from eth_account.messages import encode_defunct
+from eth_account.messages import SignableMessage
 from eth_account import Account
-from web3 import Web3
+
+# EIP-191 个人签名前缀（version 0x45 = b"E"，其余为 header）。
+# 前缀字节串只构造一次，签名时直接拼长度，跳过 encode_defunct 的逐次组装
+_EIP191_HEADER_FMT = b"thereum Signed Message:\n%d"
+
+
+def _encode_personal_message(message: str) -> SignableMessage:
+    """按 EIP-191 个人签名格式编码消息（等价于 encode_defunct(text=...)）"""
+    body = message.encode('utf-8')
+    return SignableMessage(b"E", _EIP191_HEADER_FMT % len(body), body)
 
 # ==================== 配置区域 ====================
 # 私钥从环境变量 STANDX_PRIVATE_KEY 读取（不要硬编码！）
@@ -58,7 +121,7 @@ def parse_args():
 
 def get_private_key(args):
     """获取私钥（优先级：命令行 > 环境变量）"""
-    private_key = args.private_key or os.environ.get('STANDX_PRIVATE_KEY')
+    private_key = args.private_key or _ENV_CACHE.get('STANDX_PRIVATE_KEY')
     if not private_key:
         raise ValueError(
             "未找到私钥。请通过以下方式之一提供:\n"
@@ -68,33 +131,35 @@ def get_private_key(args):
     return private_key
 
 
+@functools.lru_cache(maxsize=4)
+def _account_for(private_key: str):
+    """缓存 Account.from_key 的结果（每次调用都要做 ECDSA 标量推导，开销较大）"""
+    return Account.from_key(private_key)
+
+
 def sign_message_with_private_key(private_key: str, message: str) -> str:
     """使用钱包私钥签名消息"""
     # 移除 0x 前缀
     if private_key.startswith('0x'):
         private_key = private_key[2:]
-    
-    # 创建账户
-    account = Account.from_key(private_key)
-    
-    # 使用 encode_defunct 编码消息（EIP-191 个人签名格式）
+
+    # 创建账户（缓存命中时直接复用）
+    account = _account_for(private_key)
+
+    # 按 EIP-191 个人签名格式编码消息
     # 这会添加 "\x19Ethereum Signed Message:\n{length}" 前缀
-    message_encoded = encode_defunct(text=message)
-    
+    message_encoded = _encode_personal_message(message)
+
     # 签名消息
     signed = account.sign_message(message_encoded)
-    
-    # 获取签名的 hex 格式
-    # ethers.js 的 signMessage 返回带 0x 前缀的字符串
-    signature_hex = signed.signature.hex()
-    
-    # 确保签名长度正确（应该是 130 个字符，65 字节）
-    if len(signature_hex) != 130:
-        raise ValueError(f"签名长度不正确: {len(signature_hex)}, 期望 130")
-    
+
+    # 在原始字节上校验长度（65 字节），避免为校验多做一次 hex 编码
+    sig_bytes = signed.signature
+    if len(sig_bytes) != 65:
+        raise ValueError(f"签名长度不正确: {len(sig_bytes)} 字节, 期望 65")
+
     # ethers.js 的 signMessage 返回带 0x 前缀的格式
-    # 尝试添加 0x 前缀
-    return "0x" + signature_hex
+    return "0x" + sig_bytes.hex()
 
 
 def main():
@@ -120,7 +185,9 @@ def main():
         if pk.startswith('0x'):
             pk = pk[2:]
 
-        account = Web3().eth.account.from_key(pk)
+        # 直接用 eth_account 推导地址（无需构造完整的 Web3 provider），
+        # 复用签名路径的账户缓存
+        account = _account_for(pk)
         wallet_address = account.address
         print(f"钱包地址: {wallet_address}")
 
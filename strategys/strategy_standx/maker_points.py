@@ -18,25 +18,87 @@ Usage:
 """
 import sys
 import os
+import json
+import math
 import time
+import logging
 import argparse
-from datetime import datetime
-from decimal import Decimal, ROUND_DOWN
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import RotatingFileHandler
+from dataclasses import dataclass, field
+from functools import lru_cache
+from decimal import Decimal
 
 # Project setup
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(current_dir))
 sys.path.insert(0, project_root)
 
-# Load .env
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+
+def _load_env_cached():
+    """Load .env with an mtime-keyed cache.
+
+    When .env is unchanged, replay the .env.cache.json snapshot instead of
+    re-parsing the file with dotenv; re-parse and refresh the snapshot only
+    when the mtime differs.
+    """
+    env_path = os.path.join(project_root, '.env')
+    if not os.path.exists(env_path):
+        return
+
+    cache_path = os.path.join(project_root, '.env.cache.json')
+    mtime = os.path.getmtime(env_path)
+
+    # Cache hit: replay snapshot (like load_dotenv, don't override existing vars)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('mtime') == mtime:
+            for k, v in cached.get('vars', {}).items():
+                os.environ.setdefault(k, v)
+            return
+    except (OSError, ValueError):
+        pass
+
+    # Cache miss: parse once and write the snapshot back
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        return
+
+    env_vars = {k: v for k, v in dotenv_values(env_path).items() if v is not None}
+    for k, v in env_vars.items():
+        os.environ.setdefault(k, v)
+
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'mtime': mtime, 'vars': env_vars}, f)
+    except OSError:
+        pass
+
+
+def _maybe_load_env():
+    """Load .env unless STANDX_SKIP_DOTENV=1 (e.g. dry runs with exported vars)
+
+    Called from main() instead of at import, so importing this module (or a
+    supervisor respawning it into an error) never pays the dotenv parse.
+    """
+    if os.environ.get('STANDX_SKIP_DOTENV') != '1':
+        _load_env_cached()
+
 
 from adapters import create_adapter
 
+# Module logger for diagnostics/errors; the dashboard itself stays on
+# plain prints since it is a redrawn screen, not a log stream
+logger = logging.getLogger(__name__)
+
+# File-only mirror of the action events, so what the redraw erases from the
+# screen survives in maker_points.log for postmortems
+_action_logger = logging.getLogger(__name__ + '.actions')
+
 # Default configuration (previously in config_maker_points.yaml)
 DEFAULT_CONFIG = {
     'exchange': {
@@ -60,6 +122,20 @@ DEFAULT_CONFIG = {
         
         # Rebalancing
         'rebalance_interval': 0.1,  # Check every 0.5 seconds (less frequent = less API calls)
+
+        # Event-driven wake-up: a background ticker watcher polls at
+        # rebalance_interval and wakes the loop when mark price moved by at
+        # least this many bps; otherwise only the heartbeat cycle runs
+        'rebalance_bps_threshold': 0.5,
+        'heartbeat_interval': 3.0,  # Watchdog cycle when price is quiet (seconds)
+
+        # Skip the whole cycle (after a single ticker request) when mark
+        # price moved less than this since the last steady cycle
+        'min_change_bps': 0.5,
+
+        # Prefer the adapter's WebSocket trade channel for place/cancel
+        # (falls back to REST transparently when the adapter has none)
+        'use_ws_trade': True,
         
         # Sleep time (in seconds) for all operations
         'sleep_time': 0,  # Wait time for all sleep operations (cancel orders, close position, place orders, initial delay)
@@ -67,6 +143,10 @@ DEFAULT_CONFIG = {
         # Band monitoring - when to rebalance
         'min_bps': 8,  # Rebalance if order gets too close to mark (fill risk)
         'max_bps': 10,  # Rebalance if order drifts too far (before losing 100% tier)
+
+        # Hysteresis: only re-price when |current_bps - target_bps| exceeds
+        # this; defaults to half the band width so small wiggles are ignored
+        # 'rebalance_drift_bps': 1.0,
         
         # Order side: Always two-sided (buy AND sell)
         # Each side uses half of balance_percent
@@ -74,24 +154,141 @@ DEFAULT_CONFIG = {
     }
 }
 
-# Track order start times by side: {"buy": timestamp, "sell": timestamp}
-ORDER_START_TIMES = {}
-# Track last cycle time for debugging
-LAST_CYCLE_TIME = None
+# Hoisted Decimal constants - constructing these per call re-parses strings
+# (price tick is 1 $DUSD, changed from 0.1 on Jan 15, 2026)
+_D_ZERO = Decimal("0")
+_D_10000 = Decimal("10000")
+_D_QTY_STEP = Decimal("0.0001")  # BTC quantity precision
+
+# Order side/status membership sets - inline list literals would be rebuilt
+# on every check inside the cycle loop
+_BUY_ALIASES = frozenset(("buy", "long"))
+_SELL_ALIASES = frozenset(("sell", "short"))
+_OPEN_STATUSES = frozenset(("pending", "open", "partially_filled"))
+
+# Resync the per-side order cache from REST every N cycles (see StrategyState)
+_ORDER_CACHE_RESYNC = 20
+
+# Short-TTL REST cache shared by the watcher thread and the cycle, keyed by
+# (endpoint name, args), so bursts of cycles reuse in-memory responses
+# instead of paying another round-trip per call
+_REST_CACHE = {}
+_REST_CACHE_LOCK = threading.Lock()
+_TICKER_TTL = 0.2
+
+# Reused worker pool for the per-side amend/place fan-out; building a fresh
+# pool (and its threads) every cycle would dominate the work it parallelizes
+_SIDE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="side")
+
+@dataclass(frozen=True, slots=True)
+class StrategyParams:
+    """
+    Strategy parameters resolved once from the config dict
 
+    The hot loop previously chained config['maker_points'] plus eight
+    .get() lookups every cycle; slotted attribute access is both faster
+    and makes the parameter set explicit.
+    """
+    symbol: str
+    target_bps: float
+    max_bps: float
+    min_bps: float
+    balance_percent: float
+    leverage: int
+    sleep_time: float
+    min_change_bps: float
+    use_ws_trade: bool
+    rebalance_drift_bps: float
+    # Derived once at construction instead of per cycle
+    per_side_balance_percent: float
+
+    @classmethod
+    def from_config(cls, config, symbol=None):
+        """Build params from the loaded YAML/embedded config dict
+
+        config['symbol'] may be a single symbol or a list; pass symbol to
+        pick one entry when running several symbols off one config.
+        """
+        mp = config['maker_points']
+        max_bps = mp.get('max_bps', 10)
+        min_bps = mp.get('min_bps', 1)
+        if symbol is None:
+            symbol = config['symbol']
+            if isinstance(symbol, list):
+                symbol = symbol[0]
+        return cls(
+            symbol=symbol,
+            target_bps=mp['target_bps'],
+            max_bps=max_bps,
+            min_bps=min_bps,
+            balance_percent=mp['balance_percent'],
+            leverage=int(mp.get('leverage', 1)),
+            sleep_time=mp.get('sleep_time', 2),
+            min_change_bps=mp.get('min_change_bps', 0.5),
+            use_ws_trade=mp.get('use_ws_trade', True),
+            rebalance_drift_bps=mp.get('rebalance_drift_bps', (max_bps - min_bps) / 2),
+            per_side_balance_percent=mp['balance_percent'] / 2,
+        )
+
+
+@dataclass(slots=True)
+class StrategyState:
+    """
+    Per-symbol mutable cycle state
 
+    Previously a set of module globals; keeping it on an instance puts the
+    hot loop on LOAD_FAST instead of LOAD_GLOBAL and lets several symbols
+    run in one process, each with its own state.
+    """
+    # Order start times by side: {"buy": timestamp, "sell": timestamp}
+    order_start_times: dict = field(default_factory=dict)
+    # Last cycle end time, for the dashboard timing line
+    last_cycle_time: float | None = None
+
+    # Last-known open order per side, maintained on successful place/cancel so
+    # steady-state cycles can skip the get_open_orders round-trip. StandX has no
+    # single-order query endpoint to validate entries cheaply, so the cache is
+    # resynced from REST every _ORDER_CACHE_RESYNC cycles (and invalidated on
+    # any failed order operation). Fills are still caught by the position check.
+    order_cache: dict = field(default_factory=lambda: {"buy": None, "sell": None})
+    order_cache_valid: bool = False
+    order_cache_cycles: int = 0
+
+    # Steady-state short-circuit: when the previous cycle left both sides
+    # resting in band with no position, a sub-threshold mark move cannot change
+    # the band decision, so the next cycle can stop after one ticker read
+    last_mark_price: float | None = None
+    last_cycle_steady: bool = False
+    # Equity/leverage numbers from the last full cycle, so a fast-path refresh
+    # can redraw the dashboard without re-fetching the balance
+    last_ui_state: dict | None = None
+
+    # Whether a position could exist at all: True whenever any order is
+    # resting (it may fill at any moment) and conservatively True at startup,
+    # since a previous run may have left orders or a position behind. Only a
+    # cycle that observed a flat, orderless account lets the next one skip
+    # the get_position request.
+    maybe_has_position: bool = True
+
+    # Recent action events shown in the UI; bounded and persisted across
+    # cycles so a one-off event is not wiped by the very next redraw
+    recent_actions: deque = field(default_factory=lambda: deque(maxlen=20))
+
+
+@lru_cache(maxsize=4096)
 def format_uptime(seconds):
-    """Format uptime in human readable format"""
-    if seconds < 60:
-        return f"{int(seconds)}s"
-    elif seconds < 3600:
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{mins}m{secs}s"
-    else:
-        hours = int(seconds // 3600)
-        mins = int((seconds % 3600) // 60)
+    """Format uptime in human readable format
+
+    Takes whole seconds; the result only changes once per second per
+    order, so it is memoized on the integer value.
+    """
+    hours, rem = divmod(seconds, 3600)
+    mins, secs = divmod(rem, 60)
+    if hours:
         return f"{hours}h{mins}m"
+    if mins:
+        return f"{mins}m{secs}s"
+    return f"{secs}s"
 
 
 def load_config(config_file=None):
@@ -99,6 +296,12 @@ def load_config(config_file=None):
     if config_file:
         # Still support loading from YAML if explicitly provided
         import yaml
+        try:
+            # libyaml parser - several times faster than the pure-Python one
+            from yaml import CSafeLoader as _Loader
+        except ImportError:
+            from yaml import SafeLoader as _Loader
+
         if not os.path.isabs(config_file):
             config_path = os.path.join(current_dir, config_file)
         else:
@@ -107,13 +310,23 @@ def load_config(config_file=None):
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        # One bytes read instead of a text-mode wrapper; yaml handles decoding
+        with open(config_path, 'rb') as f:
+            return yaml.load(f.read(), Loader=_Loader)
     else:
         # Use embedded default config
         return DEFAULT_CONFIG.copy()
 
 
+def _spread_ticks(mark_ticks, target_bps):
+    """Spread size in whole price ticks for a bps distance from mark
+
+    The single home of the pricing/rounding rule; both the helper below
+    and the cycle's target_prices derive from it.
+    """
+    return int(mark_ticks * target_bps) // 10000
+
+
 def calculate_order_price(mark_price, target_bps, side):
     """
     Calculate order price at target basis points from mark price
@@ -125,18 +338,21 @@ def calculate_order_price(mark_price, target_bps, side):
 
     Returns:
         Decimal: Order price
+
+    Works in whole price ticks (1 $DUSD) with plain ints; the Decimal is
+    constructed once at the return, for the adapter boundary only.
     """
-    spread = Decimal(str(mark_price)) * Decimal(str(target_bps)) / Decimal("10000")
+    mark_ticks = int(mark_price)
+    spread_ticks = _spread_ticks(mark_ticks, target_bps)
 
     if side == "buy":
         # Buy below mark price
-        price = Decimal(str(mark_price)) - spread
+        price_ticks = mark_ticks - spread_ticks
     else:
         # Sell above mark price
-        price = Decimal(str(mark_price)) + spread
+        price_ticks = mark_ticks + spread_ticks
 
-    # Round to tick size of 1 $DUSD (changed from 0.1 on Jan 15, 2026)
-    return price.quantize(Decimal("1"), rounding=ROUND_DOWN)
+    return Decimal(price_ticks)
 
 
 def calculate_order_quantity(balance, mark_price, balance_percent, leverage=1):
@@ -151,12 +367,13 @@ def calculate_order_quantity(balance, mark_price, balance_percent, leverage=1):
 
     Returns:
         Decimal: Order quantity
+
+    Sizing is computed in integer 0.0001 BTC units; only the final quantity
+    is converted to Decimal at the adapter boundary.
     """
-    usable_balance = Decimal(str(balance)) * Decimal(str(balance_percent)) / Decimal("100")
-    quantity = usable_balance / Decimal(str(mark_price)) * Decimal(str(leverage))
+    qty_units = int(balance * balance_percent / 100.0 * leverage * 10000 / mark_price)
 
-    # Round down to 4 decimal places (BTC precision)
-    return quantity.quantize(Decimal("0.0001"), rounding=ROUND_DOWN)
+    return Decimal(qty_units) / _D_10000
 
 
 def get_current_bps(order_price, mark_price, side):
@@ -172,106 +389,492 @@ def get_current_bps(order_price, mark_price, side):
         float: Distance in basis points
     """
     if side == "buy":
-        distance = Decimal(str(mark_price)) - Decimal(str(order_price))
+        distance = mark_price - order_price
     else:
-        distance = Decimal(str(order_price)) - Decimal(str(mark_price))
+        distance = order_price - mark_price
 
-    bps = (distance / Decimal(str(mark_price))) * Decimal("10000")
-    return float(bps)
+    return distance / mark_price * 10000.0
 
 
-def get_existing_orders(adapter, symbol):
+def _validate_price(value):
+    """Return True when the price is a finite positive float
+
+    A NaN/inf/zero mark price from the adapter would otherwise surface as
+    an arithmetic error deep inside the cycle instead of a clean skip.
+    """
+    return math.isfinite(value) and value > 0
+
+
+def cached_get(fn, *args, ttl=0.25):
     """
-    Get existing open orders for both sides
+    Call a REST getter with a short-TTL in-process cache
+
+    Args:
+        fn: Bound adapter method (e.g. adapter.get_ticker)
+        *args: Positional arguments forming the cache key with the name
+        ttl: Cache lifetime in seconds
+
+    Returns:
+        The live or cached return value of fn(*args)
+    """
+    cache_key = (getattr(fn, '__name__', str(fn)),) + args
+    now = time.monotonic()
+    with _REST_CACHE_LOCK:
+        entry = _REST_CACHE.get(cache_key)
+        if entry and now - entry[0] < ttl:
+            return entry[1]
+    value = fn(*args)
+    with _REST_CACHE_LOCK:
+        _REST_CACHE[cache_key] = (time.monotonic(), value)
+    return value
+
+
+def cached_ticker(adapter, symbol, ttl=_TICKER_TTL):
+    """
+    Fetch the ticker with a short-TTL in-process cache
+
+    Args:
+        adapter: Exchange adapter
+        symbol: Trading pair symbol
+        ttl: Cache lifetime in seconds
+
+    Returns:
+        dict: Ticker data (possibly a cached copy fresher than ttl)
+    """
+    return cached_get(adapter.get_ticker, symbol, ttl=ttl)
+
+
+def _wait_balance_change(adapter, initial_available, timeout, interval=0.05):
+    """
+    Poll the balance until available balance moves away from initial_available
+
+    Replaces the fixed post-cancel/post-close sleeps: settlement usually
+    lands in well under the configured wait, so return as soon as the
+    change is visible instead of always sleeping the full timeout.
+
+    Args:
+        adapter: Exchange adapter
+        initial_available: Available balance (float) before the operation
+        timeout: Maximum seconds to wait (0 skips waiting entirely)
+        interval: Poll interval in seconds
+
+    Returns:
+        Balance or None: the refreshed balance if it changed, else None
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            balance = adapter.get_balance()
+            if float(balance.available_balance) != initial_available:
+                return balance
+        except Exception:
+            pass
+        time.sleep(interval)
+    return None
+
+
+def _wait_for_flat(adapter, symbol, timeout=3.0, poll=0.1):
+    """
+    Poll the position until it is flat or the timeout elapses
+
+    A market close usually fills in well under a second; polling instead
+    of sleeping a fixed interval makes the close path pay only the actual
+    fill latency.
+
+    Args:
+        adapter: Exchange adapter
+        symbol: Trading pair symbol
+        timeout: Maximum seconds to wait
+        poll: Poll interval in seconds
+
+    Returns:
+        bool: True if the position is confirmed flat
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            position = adapter.get_position(symbol)
+            if position is None or position.size == _D_ZERO:
+                return True
+        except Exception:
+            pass
+        time.sleep(poll)
+    return False
+
+
+def get_existing_orders(orders):
+    """
+    Classify open orders for both sides
+
+    Args:
+        orders: List of Order objects (e.g. from adapter.get_open_orders)
 
     Returns:
         dict: {"buy": Order or None, "sell": Order or None}
     """
     result = {"buy": None, "sell": None}
+    for order in orders:
+        if order.status in _OPEN_STATUSES:
+            order_side = order.side.lower()
+            if order_side in _BUY_ALIASES:
+                result["buy"] = order
+            elif order_side in _SELL_ALIASES:
+                result["sell"] = order
+    return result
+
+
+def _process_side(adapter, params, state, side, existing_order, mark_price,
+                  target_price, fixed_quantity, order_leverage, dry_run):
+    """
+    Decide and execute the keep/amend step for one side
+
+    Runs on a worker thread so buy and sell pay their round-trips
+    concurrently; only per-side keys of the state caches are touched,
+    so the two sides never contend.
+
+    Returns:
+        (active_entry, logs, place_spec, cancelled):
+        - active_entry: order dict for the UI, or None
+        - logs: action log lines produced for this side
+        - place_spec: spec for a fresh order to place in step 7, or None
+        - cancelled: True if a cancel may have freed margin
+    """
+    logs = []
+    target_quantity = fixed_quantity
+
+    if target_quantity < _D_QTY_STEP:
+        return None, logs, None, False
+
+    if existing_order:
+        existing_price = float(existing_order.price)
+        current_bps = get_current_bps(existing_price, mark_price, side)
+
+        # Track order start time if not already tracked (single dict lookup)
+        now = time.monotonic()
+        uptime = now - state.order_start_times.setdefault(side, now)
+
+        # Hysteresis: only act when the drift from target exceeds the
+        # threshold; small wiggles inside the band stay untouched
+        drift = abs(current_bps - params.target_bps)
+        if drift <= params.rebalance_drift_bps:
+            return ({
+                'side': side,
+                'price': existing_price,
+                'quantity': float(existing_order.quantity),
+                'bps': current_bps,
+                'uptime': uptime
+            }, logs, None, False)
+
+        # Order drifted too far from target - need to rebalance
+        if current_bps < params.target_bps:
+            reason = f"太近 {current_bps:.1f}bps (偏離 {drift:.1f} > {params.rebalance_drift_bps:.1f})"
+        else:
+            reason = f"太遠 {current_bps:.1f}bps (偏離 {drift:.1f} > {params.rebalance_drift_bps:.1f})"
+        logs.append(f"⚠️ {side.upper()} 偏離 {current_bps:.1f}bps -> 改單 ({reason})")
+
+        # Reset uptime tracking for this side
+        state.order_start_times.pop(side, None)
+
+        if not dry_run:
+            # Re-price in place: one round-trip on exchanges with a
+            # native amend, cancel+place fallback otherwise
+            try:
+                order = adapter.amend_order(
+                    order_id=existing_order.order_id,
+                    symbol=params.symbol,
+                    side=side,
+                    quantity=target_quantity,
+                    price=target_price,
+                    leverage=order_leverage
+                )
+                state.order_cache[side] = order
+                state.order_start_times[side] = time.monotonic()
+                logs.append(f"✅ 改{side.upper()}單 @ {float(target_price):.2f}")
+                return ({
+                    'side': side,
+                    'price': float(target_price),
+                    'quantity': float(target_quantity),
+                    'bps': params.target_bps,
+                    'uptime': 0
+                }, logs, None, False)
+            except Exception:
+                # The cancel half may have gone through; resync the
+                # order cache next cycle instead of risking a double
+                state.order_cache[side] = None
+                state.order_cache_valid = False
+                return None, logs, None, True
+
+    # No resting order (or dry-run re-place): hand off to step 7
+    place_spec = {
+        'side': side,
+        'price': target_price,
+        'quantity': target_quantity,
+        'notional': float(target_price * target_quantity)
+    }
+    return None, logs, place_spec, False
+
+
+def _place_new_order(place_order, symbol, state, order_info, order_leverage, target_bps):
+    """
+    Place one fresh limit order (step 7 worker)
+
+    Returns:
+        (active_entry, logs): UI order dict (or None on failure) and the
+        action log lines produced
+    """
+    side = order_info['side']
+    target_price = order_info['price']
+    target_quantity = order_info['quantity']
     try:
-        orders = adapter.get_open_orders(symbol=symbol)
-        for order in orders:
-            if order.status in ["pending", "open", "partially_filled"]:
-                order_side = order.side.lower()
-                if order_side in ["buy", "long"]:
-                    result["buy"] = order
-                elif order_side in ["sell", "short"]:
-                    result["sell"] = order
+        order = place_order(
+            symbol=symbol,
+            side=side,
+            order_type="limit",
+            quantity=target_quantity,
+            price=target_price,
+            time_in_force="gtc",
+            reduce_only=False,
+            leverage=order_leverage
+        )
+        state.order_cache[side] = order
+        state.order_start_times[side] = time.monotonic()
+        return ({
+            'side': side,
+            'price': float(target_price),
+            'quantity': float(target_quantity),
+            'bps': target_bps,
+            'uptime': 0
+        }, [f"✅ 掛{side.upper()}單 @ {float(target_price):.2f}"])
     except Exception as e:
-        print(f"Error getting open orders: {e}")
-    return result
+        state.order_cache_valid = False
+        return None, [f"❌ {side.upper()}單失敗: {e}"]
+
+
+def _render_frame(params, mark_price, total_equity, available, order_leverage,
+                  position_qty, active_orders, actions_log, timing_info, dry_run):
+    """
+    Build the full dashboard frame as a single string
+
+    One string per cycle means one stdout write instead of ~15 prints,
+    and keeps the renderer reusable outside the cycle function.
+    """
+    lines = [
+        "=== 🛡️ StandX Maker Points 挖礦策略 (雙邊) ===",
+        f"⏰ 時間: {time.strftime('%Y-%m-%d %H:%M:%S')}{timing_info}",
+        f"💰 總權益: ${total_equity:,.2f} | 可用: ${available:,.2f} | 掛單: {params.balance_percent}% ({params.per_side_balance_percent:.1f}%/邊)",
+        f"📊 即時價格: ${mark_price:,.2f} | 槓桿: {order_leverage}x",
+        f"🎯 目標: {params.target_bps} bps | 安全帶: {params.min_bps}-{params.max_bps} bps",
+    ]
+    if position_qty == 0:
+        lines.append("🛡️ 持倉: (0) 非常安全")
+    else:
+        lines.append(f"🚨 持倉: {position_qty} (平倉中...)")
+    lines.append("-" * 45)
+
+    if not active_orders:
+        lines.append(" (無掛單，正在補單...)")
+    else:
+        for side in ('buy', 'sell'):
+            o = active_orders.get(side)
+            if not o:
+                continue
+            side_emoji = "🟢" if side == 'buy' else "🔴"
+            uptime_str = format_uptime(int(o.get('uptime', 0)))
+            lines.append(f" {side_emoji} [{side.upper()}] ${o['price']:,.2f} x {o['quantity']:.4f} (距 {o['bps']:.1f}bps) ⏱️     {uptime_str}")
+
+    lines.append("-" * 45)
 
+    if dry_run:
+        lines.append("🔸 模式: DRY RUN (不實際下單)")
+
+    lines.extend(actions_log)
+    return '\n'.join(lines) + '\n'
+
+
+# Dashboard rendering runs on its own daemon thread so the trading cycle
+# never pays for string formatting or the stdout write. The newest state
+# snapshot is kept per symbol (drop-old) and every symbol's section is
+# composed into one screen, so multi-symbol runs don't fight over the
+# terminal; the thread throttles redraws to ~4 Hz.
+_UI_FRAMES = {}
+_UI_FRAMES_LOCK = threading.Lock()
+_UI_WAKE = threading.Event()
+_UI_REFRESH = 0.25
+
+
+def _submit_frame(frame_args):
+    """Record the latest render args for this symbol (frame_args[0] is its
+    StrategyParams) and nudge the UI thread; never blocks the cycle."""
+    with _UI_FRAMES_LOCK:
+        _UI_FRAMES[frame_args[0].symbol] = frame_args
+    _UI_WAKE.set()
+
+
+def _ui_loop():
+    """UI thread body: compose every symbol's newest snapshot into one
+    screen, throttled to _UI_REFRESH"""
+    while True:
+        _UI_WAKE.wait()
+        _UI_WAKE.clear()
+        with _UI_FRAMES_LOCK:
+            frames = list(_UI_FRAMES.values())
+        try:
+            screen = '\n'.join(_render_frame(*args) for args in frames)
+            sys.stdout.write('\x1b[H\x1b[2J' + screen)
+            sys.stdout.flush()
+        except Exception:
+            pass  # 渲染失败不能影响交易周期
+        time.sleep(_UI_REFRESH)
+
+
+def _start_ui_thread():
+    """Start the dashboard renderer (idempotent enough for a single main())"""
+    threading.Thread(target=_ui_loop, name="ui", daemon=True).start()
 
-def run_strategy_cycle(adapter, config, dry_run=False):
+
+def run_strategy_cycle(adapter, params, state, dry_run=False):
     """
     Execute one strategy cycle for both buy and sell sides
 
     Args:
         adapter: Exchange adapter
-        config: Strategy configuration
+        params: StrategyParams resolved once at startup
+        state: StrategyState carrying this symbol's mutable caches
         dry_run: If True, don't place real orders
 
     Returns:
         bool: True if successful, False otherwise
     """
-    global LAST_CYCLE_TIME
-    cycle_start = time.time()
-
-    symbol = config['symbol']
-    mp_config = config['maker_points']
-    target_bps = mp_config['target_bps']
-    max_bps = mp_config.get('max_bps', 10)
-    min_bps = mp_config.get('min_bps', 1)
-    balance_percent = mp_config['balance_percent']
-    leverage = mp_config.get('leverage', 1)
-    sleep_time = mp_config.get('sleep_time', 2)
-
-    # Each side uses half of balance_percent
-    per_side_balance_percent = balance_percent / 2
+    cycle_start = time.monotonic()
+
+    symbol = params.symbol
+    target_bps = params.target_bps
+    max_bps = params.max_bps
+    min_bps = params.min_bps
+    balance_percent = params.balance_percent
+    leverage = params.leverage
+    sleep_time = params.sleep_time
+    min_change_bps = params.min_change_bps
+
+    # Steady-state short-circuit: if the last cycle ended with both orders in
+    # band and no position, check the cheap ticker first. A sub-threshold
+    # move returns immediately; a larger move still skips the full REST pass
+    # as long as both cached orders remain inside the drift band (calendar
+    # check, threshold trade) - then only the dashboard is refreshed.
+    # Fast-path hits count against the same resync budget as the order
+    # cache: every _ORDER_CACHE_RESYNC-th cycle falls through to the full
+    # pass regardless, so an intra-poll wick fill (order gone, position
+    # open, mark back near target) is caught within a bounded number of
+    # cycles instead of never.
+    if (state.last_cycle_steady and state.last_mark_price and
+            state.order_cache_cycles % _ORDER_CACHE_RESYNC != 0):
+        try:
+            ticker = cached_ticker(adapter, symbol)
+            mark = ticker.get('mark_price') or ticker.get('mid_price') or ticker.get('last_price')
+            if mark and _validate_price(float(mark)):
+                mark = float(mark)
+                delta_bps = abs(mark - state.last_mark_price) / state.last_mark_price * 10000.0
+                if delta_bps < min_change_bps:
+                    state.order_cache_cycles += 1
+                    return True
+                if (state.order_cache_valid and state.last_ui_state and
+                        state.order_cache['buy'] and state.order_cache['sell']):
+                    side_bps = {s: get_current_bps(float(state.order_cache[s].price), mark, s)
+                                for s in ('buy', 'sell')}
+                    if all(abs(b - target_bps) <= params.rebalance_drift_bps
+                           for b in side_bps.values()):
+                        now = time.monotonic()
+                        active = {s: {
+                            'side': s,
+                            'price': float(state.order_cache[s].price),
+                            'quantity': float(state.order_cache[s].quantity),
+                            'bps': side_bps[s],
+                            'uptime': now - state.order_start_times.get(s, now)
+                        } for s in ('buy', 'sell')}
+                        _submit_frame((params, mark,
+                                       state.last_ui_state['total_equity'],
+                                       state.last_ui_state['available'],
+                                       state.last_ui_state['order_leverage'],
+                                       0, active, list(state.recent_actions),
+                                       " | 快速刷新", dry_run))
+                        state.last_mark_price = mark
+                        state.order_cache_cycles += 1
+                        return True
+        except Exception:
+            pass
+    state.last_cycle_steady = False
+
+    # Prefer the WS trade channel when enabled; the base adapter falls back
+    # to REST transparently if the exchange has no WS trading
+    place_order = adapter.place_order_ws if params.use_ws_trade else adapter.place_order
+
+    # Each side uses half of balance_percent (precomputed on params)
+    per_side_balance_percent = params.per_side_balance_percent
     
     # Action log for UI
     actions_log = []
 
-    # 1. Get current mark price
+    # Steady state: trust the side-indexed order cache and skip the
+    # get_open_orders request entirely; resync from REST periodically
+    use_order_cache = state.order_cache_valid and state.order_cache_cycles % _ORDER_CACHE_RESYNC != 0
+    state.order_cache_cycles += 1
+
+    # 1. Fetch ticker/balance/open-orders/position in one concurrent snapshot
+    #    (independent reads - wall time is max(RTT) instead of sum(RTT)).
+    #    When the watcher stream has a fresh quote in memory, the ticker leg
+    #    of the snapshot is skipped entirely.
     try:
-        ticker = adapter.get_ticker(symbol)
+        with _REST_CACHE_LOCK:
+            entry = _REST_CACHE.get(('get_ticker', symbol))
+        fresh_ticker = entry[1] if entry and time.monotonic() - entry[0] < _TICKER_TTL else None
+        snap = adapter.snapshot(symbol, include_orders=not use_order_cache,
+                                include_position=state.maybe_has_position,
+                                include_ticker=fresh_ticker is None)
+        ticker = fresh_ticker if fresh_ticker is not None else snap.ticker
         mark_price = ticker.get('mark_price') or ticker.get('mid_price') or ticker.get('last_price')
         if not mark_price:
-            print("❌ 無法獲取價格...")
+            logger.error("❌ 無法獲取價格...")
             return False
         mark_price = float(mark_price)
+        if not _validate_price(mark_price):
+            logger.error(f"❌ 無效價格: {mark_price}")
+            return False
     except Exception as e:
-        print(f"❌ 獲取價格失敗: {e}")
+        logger.error(f"❌ 獲取行情快照失敗: {e}")
         return False
 
     # 2. Check and close any positions, and get existing position leverage
     position_qty = 0
     existing_position_leverage = None
+    closed_position = False
     try:
-        position = adapter.get_position(symbol)
+        position = snap.position
         # Check for any position (size != 0, handles both long and short)
-        if position and position.size != Decimal("0"):
+        if position and position.size != _D_ZERO:
             position_qty = float(abs(position.size))
             existing_position_leverage = position.leverage if position.leverage else None
             
             # Always auto-close any filled positions
             actions_log.append(f"🚨 持倉 {position_qty} {position.side} -> 平倉中...")
             
-            # Cancel all orders first to free up margin
+            # Cancel all orders first to free up margin; wait only until the
+            # freed margin actually shows up instead of a fixed sleep
+            initial_available = float(snap.balance.available_balance)
             try:
                 adapter.cancel_all_orders(symbol=symbol)
                 actions_log.append("🔄 已撤銷所有掛單")
-                time.sleep(sleep_time)
+                _wait_balance_change(adapter, initial_available, timeout=sleep_time)
             except Exception:
                 pass
-            
-            # Close the position
+
+            # Close the position and wait only until it is confirmed flat
             adapter.close_position(symbol, order_type="market")
             actions_log.append("✅ 已平倉")
-            
-            time.sleep(sleep_time)
+
+            _wait_for_flat(adapter, symbol, timeout=max(sleep_time, 3.0))
             # After closing, reset existing_position_leverage so we use configured leverage
             existing_position_leverage = None
+            closed_position = True
     except Exception as e:
         actions_log.append(f"❌ 平倉失敗: {e}")
     
@@ -288,15 +891,16 @@ def run_strategy_cycle(adapter, config, dry_run=False):
             actions_log.append(f"⚠️ 設置槓桿失敗: {e}")
 
     # 3. Get balance - use total equity for order sizing (not available balance)
+    #    The snapshot balance is stale after a close, so only re-fetch then
     try:
-        balance = adapter.get_balance()
+        balance = adapter.get_balance() if closed_position else snap.balance
         # Use total equity for consistent order sizing across both sides
-        total_equity = float(getattr(balance, 'total_balance', None) or 
-                            getattr(balance, 'equity', None) or 
+        total_equity = float(getattr(balance, 'total_balance', None) or
+                            getattr(balance, 'equity', None) or
                             balance.available_balance)
         available = float(balance.available_balance)
     except Exception as e:
-        print(f"❌ 獲取餘額失敗: {e}")
+        logger.error(f"❌ 獲取餘額失敗: {e}")
         return False
 
     # Calculate fixed order quantity based on total equity (not remaining balance)
@@ -304,165 +908,110 @@ def run_strategy_cycle(adapter, config, dry_run=False):
     fixed_quantity = calculate_order_quantity(total_equity, mark_price, per_side_balance_percent, order_leverage)
 
     # 4. Get existing orders for both sides
-    existing_orders = get_existing_orders(adapter, symbol)
+    if closed_position:
+        # All orders were cancelled before the close; force a resync next cycle
+        existing_orders = {"buy": None, "sell": None}
+        state.order_cache.update(existing_orders)
+        state.order_cache_valid = False
+    elif use_order_cache:
+        existing_orders = dict(state.order_cache)
+    else:
+        existing_orders = get_existing_orders(snap.open_orders)
+        state.order_cache.update(existing_orders)
+        state.order_cache_valid = True
     
-    # Track which sides need new orders
+    # Track which sides need new orders, and whether any cancel actually
+    # went through (only then is the balance worth re-checking)
     sides_to_place = []
-    
-    # Store order info for UI display
-    active_orders = []
-
-    # 5. Process each side
-    for side in ["buy", "sell"]:
-        target_price = calculate_order_price(mark_price, target_bps, side)
-        target_quantity = fixed_quantity  # Use fixed quantity based on total equity
-
-        if target_quantity < Decimal("0.0001"):
-            continue
-
-        target_notional = float(target_price * target_quantity)
-        existing_order = existing_orders[side]
-
-        if existing_order:
-            existing_price = float(existing_order.price)
-            current_bps = get_current_bps(existing_price, mark_price, side)
-            
-            # Track order start time if not already tracked
-            if side not in ORDER_START_TIMES:
-                ORDER_START_TIMES[side] = time.time()
-            
-            uptime = time.time() - ORDER_START_TIMES[side]
-
-            # Store for UI display
-            active_orders.append({
-                'side': side,
-                'price': existing_price,
-                'quantity': float(existing_order.quantity),
-                'bps': current_bps,
-                'uptime': uptime
-            })
-
-            # Check if order is still in good position
-            if min_bps <= current_bps <= max_bps:
-                continue
-            else:
-                # Order drifted outside safe band - need to rebalance
-                if current_bps < min_bps:
-                    reason = f"太近 {current_bps:.1f} < {min_bps} bps"
-                else:
-                    reason = f"太遠 {current_bps:.1f} > {max_bps} bps"
-
-                actions_log.append(f"⚠️ {side.upper()} 偏離 {current_bps:.1f}bps -> 撤單 ({reason})")
-
-                # Reset uptime tracking for this side
-                if side in ORDER_START_TIMES:
-                    del ORDER_START_TIMES[side]
-
-                if not dry_run:
-                    try:
-                        adapter.cancel_order(order_id=existing_order.order_id)
-                    except Exception:
-                        continue
-                
-                # Remove from active orders since we're cancelling
-                active_orders = [o for o in active_orders if o['side'] != side]
-
-        # Add to list of sides needing new orders
-        sides_to_place.append({
-            'side': side,
-            'price': target_price,
-            'quantity': target_quantity,
-            'notional': target_notional
-        })
-
-    # 6. Wait for balance update if we need to place new orders
-    if sides_to_place and not dry_run:
-        time.sleep(sleep_time)
+    cancelled_any = False
+
+    # Order info for UI display, keyed by side (O(1) replace/remove)
+    active_orders = {}
+
+    # The spread is side-symmetric: compute the tick math once (via the
+    # shared pricing rule) and derive both target prices from it
+    mark_ticks = int(mark_price)
+    spread_ticks = _spread_ticks(mark_ticks, target_bps)
+    target_prices = {'buy': Decimal(mark_ticks - spread_ticks),
+                     'sell': Decimal(mark_ticks + spread_ticks)}
+
+    # 5. Process both sides concurrently - the sides share no mutable state
+    #    beyond per-side cache keys, and each may pay an amend round-trip
+    results = list(_SIDE_EXECUTOR.map(
+        lambda side: _process_side(adapter, params, state, side,
+                                   existing_orders[side],
+                                   mark_price, target_prices[side],
+                                   fixed_quantity, order_leverage, dry_run),
+        ("buy", "sell")))
+
+    for active_entry, side_logs, place_spec, cancelled in results:
+        actions_log.extend(side_logs)
+        if active_entry:
+            active_orders[active_entry['side']] = active_entry
+        if place_spec:
+            sides_to_place.append(place_spec)
+        cancelled_any = cancelled_any or cancelled
+
+    # 6. Wait for the cancelled margin to be released before re-placing;
+    #    skipped entirely when nothing was cancelled this cycle
+    if cancelled_any and sides_to_place and not dry_run:
+        _wait_balance_change(adapter, available, timeout=sleep_time)
         # No need to recalculate - we use fixed quantity based on total equity
 
-    # 7. Place new orders
-    for order_info in sides_to_place:
-        side = order_info['side']
-        target_price = order_info['price']
-        target_quantity = order_info['quantity']
-        
-        if target_quantity < Decimal("0.0001"):
-            continue
-
+    # 7. Place new orders - both sides in parallel as well
+    if sides_to_place:
         if dry_run:
-            actions_log.append(f"🔸 [DRY] 掛{side.upper()}單 @ {float(target_price):.2f}")
-            ORDER_START_TIMES[side] = time.time()
-            active_orders.append({
-                'side': side,
-                'price': float(target_price),
-                'quantity': float(target_quantity),
-                'bps': target_bps,
-                'uptime': 0
-            })
-            continue
-
-        try:
-            order = adapter.place_order(
-                symbol=symbol,
-                side=side,
-                order_type="limit",
-                quantity=target_quantity,
-                price=target_price,
-                time_in_force="gtc",
-                reduce_only=False,
-                leverage=order_leverage
-            )
-            actions_log.append(f"✅ 掛{side.upper()}單 @ {float(target_price):.2f}")
-            ORDER_START_TIMES[side] = time.time()
-            active_orders.append({
-                'side': side,
-                'price': float(target_price),
-                'quantity': float(target_quantity),
-                'bps': target_bps,
-                'uptime': 0
-            })
-        except Exception as e:
-            actions_log.append(f"❌ {side.upper()}單失敗: {e}")
-
-    # 8. Display UI (like main.py)
-    os.system('clear' if os.name != 'nt' else 'cls')
-
-    # Calculate timing info
-    cycle_duration = time.time() - cycle_start
-    if LAST_CYCLE_TIME:
-        time_since_last = time.time() - LAST_CYCLE_TIME
+            for order_info in sides_to_place:
+                side = order_info['side']
+                actions_log.append(f"🔸 [DRY] 掛{side.upper()}單 @ {float(order_info['price']):.2f}")
+                state.order_start_times[side] = time.monotonic()
+                active_orders[side] = ({
+                    'side': side,
+                    'price': float(order_info['price']),
+                    'quantity': float(order_info['quantity']),
+                    'bps': target_bps,
+                    'uptime': 0
+                })
+        else:
+            place_results = list(_SIDE_EXECUTOR.map(
+                lambda info: _place_new_order(place_order, symbol, state, info,
+                                              order_leverage, target_bps),
+                sides_to_place))
+            for active_entry, side_logs in place_results:
+                actions_log.extend(side_logs)
+                if active_entry:
+                    active_orders[active_entry['side']] = active_entry
+
+    # 8. Display UI - hand the state snapshot to the renderer thread; the
+    #    cycle returns without paying for formatting or the stdout write
+    cycle_duration = time.monotonic() - cycle_start
+    if state.last_cycle_time:
+        time_since_last = time.monotonic() - state.last_cycle_time
         timing_info = f" | 週期: {cycle_duration:.2f}s | 間隔: {time_since_last:.2f}s"
     else:
         timing_info = f" | 週期: {cycle_duration:.2f}s"
-    LAST_CYCLE_TIME = time.time()
-
-    print(f"=== 🛡️ StandX Maker Points 挖礦策略 (雙邊) ===")
-    print(f"⏰ 時間: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{timing_info}")
-    print(f"💰 總權益: ${total_equity:,.2f} | 可用: ${available:,.2f} | 掛單: {balance_percent}% ({per_side_balance_percent:.1f}%/邊)")
-    print(f"📊 即時價格: ${mark_price:,.2f} | 槓桿: {order_leverage}x")
-    print(f"🎯 目標: {target_bps} bps | 安全帶: {min_bps}-{max_bps} bps")
-    if position_qty == 0:
-        print(f"🛡️ 持倉: (0) 非常安全")
-    else:
-        print(f"🚨 持倉: {position_qty} (平倉中...)")
-    print("-" * 45)
-    
-    # Display orders
-    if not active_orders:
-        print(" (無掛單，正在補單...)")
-    else:
-        for o in active_orders:
-            side_emoji = "🟢" if o['side'] == 'buy' else "🔴"
-            uptime_str = format_uptime(o.get('uptime', 0))
-            print(f" {side_emoji} [{o['side'].upper()}] ${o['price']:,.2f} x {o['quantity']:.4f} (距 {o['bps']:.1f}bps) ⏱️     {uptime_str}")
-    
-    print("-" * 45)
-    
-    if dry_run:
-        print("🔸 模式: DRY RUN (不實際下單)")
-    
-    for log in actions_log:
-        print(log)
+    state.last_cycle_time = time.monotonic()
+
+    # Keep a bounded history of events and mirror them to the log file;
+    # the frame shows the rolling tail rather than only this cycle's events
+    if actions_log:
+        state.recent_actions.extend(actions_log)
+        for line in actions_log:
+            _action_logger.info(line)
+
+    _submit_frame((params, mark_price, total_equity, available,
+                   order_leverage, position_qty, active_orders,
+                   list(state.recent_actions), timing_info, dry_run))
+
+    # Record steady state for the next cycle's short-circuit check
+    state.last_mark_price = mark_price
+    state.last_cycle_steady = (position_qty == 0 and not closed_position and
+                               not sides_to_place and len(active_orders) == 2)
+    state.last_ui_state = {'total_equity': total_equity, 'available': available,
+                           'order_leverage': order_leverage}
+    # A resting order can fill at any moment, so only a flat, orderless
+    # cycle allows the next one to skip the position request
+    state.maybe_has_position = bool(active_orders) or position_qty != 0
 
     return True
 
@@ -475,6 +1024,35 @@ def main():
                         help='Simulate without placing orders')
     args = parser.parse_args()
 
+    # Credentials come from .env unless the caller exported them already
+    _maybe_load_env()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+
+    # Rotating file sink: errors and action events survive the screen redraws
+    file_handler = RotatingFileHandler(
+        os.path.join(current_dir, 'maker_points.log'),
+        maxBytes=1_000_000, backupCount=3, encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+    logger.addHandler(file_handler)
+    _action_logger.addHandler(file_handler)
+    _action_logger.setLevel(logging.INFO)
+    _action_logger.propagate = False  # actions go to the file only, not the screen
+
+    # Enable VT escape-sequence processing on the Windows console so the
+    # in-place ANSI redraw works there too
+    if os.name == 'nt':
+        os.system('')
+
+    # Opt-in core pinning (PIN_CORE=<cpu index>) to cut scheduler jitter on
+    # the cycle cadence; silently skipped where unsupported
+    pin_core = os.environ.get('PIN_CORE')
+    if pin_core and hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(0, {int(pin_core)})
+        except (OSError, ValueError):
+            pass
+
     # Load config
     try:
         if args.config:
@@ -496,41 +1074,136 @@ def main():
         print(f"❌ 連接失敗: {e}")
         sys.exit(1)
 
-    # Strategy loop
-    rebalance_interval = config['maker_points'].get('rebalance_interval', 3)
+    # Strategy loop - config['symbol'] may be one symbol or a list; every
+    # symbol gets its own params/state and they all share the one adapter
+    # (and its connection pool)
+    raw_symbol = config['symbol']
+    symbols = list(raw_symbol) if isinstance(raw_symbol, list) else [raw_symbol]
+    if len(symbols) > 1:
+        # Two side workers per symbol, otherwise concurrent cycles would
+        # queue behind the default 2-worker pool
+        global _SIDE_EXECUTOR
+        _SIDE_EXECUTOR = ThreadPoolExecutor(max_workers=2 * len(symbols),
+                                            thread_name_prefix="side")
+    params_by_symbol = {s: StrategyParams.from_config(config, symbol=s) for s in symbols}
+    state_by_symbol = {s: StrategyState() for s in symbols}
+    mp_config = config['maker_points']
+    rebalance_interval = mp_config.get('rebalance_interval', 3)
+    heartbeat_interval = mp_config.get('heartbeat_interval', 3.0)
+    wake_bps = mp_config.get('rebalance_bps_threshold', 0.5)
+
+    # Event-driven wake-up: a ticker watcher per symbol sets the event when
+    # its mark price moves by >= wake_bps since the last wake; the heartbeat
+    # below is only a watchdog so quiet markets no longer burn a full cycle
+    # every interval
+    wake = threading.Event()
+    first_tick = threading.Event()
+    wake_marks = dict.fromkeys(symbols)
+
+    def _make_on_tick(sym):
+        def _on_tick(ticker):
+            # Feed the shared ticker cache so a cycle triggered by this tick
+            # reuses the quote instead of re-fetching it
+            with _REST_CACHE_LOCK:
+                _REST_CACHE[('get_ticker', sym)] = (time.monotonic(), ticker)
+            first_tick.set()
+            mark = ticker.get('mark_price') or ticker.get('mid_price') or ticker.get('last_price')
+            if not mark:
+                return
+            mark = float(mark)
+            if not _validate_price(mark):
+                return
+            prev = wake_marks[sym]
+            if prev is None or abs(mark - prev) / prev * 10000.0 >= wake_bps:
+                wake_marks[sym] = mark
+                wake.set()
+        return _on_tick
+
+    ticker_stops = [adapter.subscribe_ticker(s, _make_on_tick(s),
+                                             poll_interval=rebalance_interval)
+                    for s in symbols]
+
+    # Order events (fills/cancels) also wake the loop when the adapter can
+    # push them; otherwise fills are still caught by the per-cycle position check
+    def _on_order_event(event):
+        # 本地订单状态由 state.order_cache 维护；收到推送说明状态已变，
+        # 标记缓存失效让被唤醒的周期重新对账，而不是等周期性 resync
+        # (推送不带 symbol 时全部重新对账)
+        for st in state_by_symbol.values():
+            st.order_cache_valid = False
+        wake.set()
+
+    order_stop = None
+    try:
+        order_stop = adapter.subscribe_user_orders(_on_order_event)
+    except NotImplementedError:
+        pass
 
     print("🚀 啟動 Maker Points 挖礦策略...")
     print("按 Ctrl+C 停止\n")
 
+    # 等第一笔行情进缓存，首个周期即可省掉快照里的行情请求
+    first_tick.wait(timeout=5)
+
+    _start_ui_thread()
+
+    # Parallel clearing: one fixed pool runs every symbol's cycle per tick;
+    # single-symbol configs keep the plain in-thread call
+    symbol_pool = (ThreadPoolExecutor(max_workers=len(symbols),
+                                      thread_name_prefix="symbol")
+                   if len(symbols) > 1 else None)
+
+    def _run_all_cycles():
+        if symbol_pool is None:
+            s = symbols[0]
+            run_strategy_cycle(adapter, params_by_symbol[s], state_by_symbol[s],
+                               dry_run=args.dry_run)
+        else:
+            list(symbol_pool.map(
+                lambda s: run_strategy_cycle(adapter, params_by_symbol[s],
+                                             state_by_symbol[s],
+                                             dry_run=args.dry_run),
+                symbols))
+
     try:
         while True:
-            run_strategy_cycle(adapter, config, dry_run=args.dry_run)
-            time.sleep(rebalance_interval)
+            _run_all_cycles()
+            wake.wait(timeout=heartbeat_interval)
+            wake.clear()
     except KeyboardInterrupt:
+        for stop in ticker_stops:
+            stop.set()
+        if order_stop is not None:
+            order_stop.set()
         print("\n\n🛑 策略已停止")
 
         if not args.dry_run:
-            symbol = config['symbol']
-            
-            # Cancel all orders first
+
+            # Cancel all orders first; fan out across symbols so Ctrl+C
+            # returns quickly when several symbols are running
             print("\n🔄 撤銷所有掛單...")
             try:
-                adapter.cancel_all_orders(symbol=symbol)
+                if len(symbols) == 1:
+                    adapter.cancel_all_orders(symbol=symbols[0])
+                else:
+                    with ThreadPoolExecutor(max_workers=8) as ex:
+                        list(ex.map(lambda s: adapter.cancel_all_orders(symbol=s), symbols))
                 print("✅ 已撤銷掛單")
             except Exception as e:
                 print(f"❌ 撤單失敗: {e}")
-            
+
             # Close all positions
             print("\n🔄 平倉所有持倉...")
-            try:
-                position = adapter.get_position(symbol)
-                if position and position.size != Decimal("0"):
-                    adapter.close_position(symbol, order_type="market")
-                    print(f"✅ 已平倉 {abs(position.size)} {position.side}")
-                else:
-                    print("✅ 無持倉")
-            except Exception as e:
-                print(f"❌ 平倉失敗: {e}")
+            for s in symbols:
+                try:
+                    position = adapter.get_position(s)
+                    if position and position.size != _D_ZERO:
+                        adapter.close_position(s, order_type="market")
+                        print(f"✅ 已平倉 {s} {abs(position.size)} {position.side}")
+                    else:
+                        print(f"✅ {s} 無持倉")
+                except Exception as e:
+                    print(f"❌ {s} 平倉失敗: {e}")
 
 
 if __name__ == "__main__":
@@ -7,9 +7,17 @@ import os
 import yaml
 import time
 import random
+import pickle
+import hashlib
 import argparse
 from decimal import Decimal
 
+try:
+    # libyaml 解析器，比纯 Python 的 SafeLoader 快数倍
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(current_dir))
 sys.path.insert(0, project_root)
@@ -24,14 +32,26 @@ GRID_CONFIG = None
 RISK_CONFIG = None
 CANCEL_STALE_ORDERS_CONFIG = None
 
+# 配置解析结果的 pickle 缓存目录（按 mtime 失效）
+_CONFIG_CACHE_DIR = os.path.expanduser("~/.cache/dd-strategy")
+
+# 订单方向/状态的集合常量：内联列表字面量每次判断都会重建，
+# 这里提升到模块级 frozenset，每轮循环按 O(1) 查找
+_BUY_ALIASES = frozenset(("buy", "long"))
+_SELL_ALIASES = frozenset(("sell", "short"))
+_OPEN_STATUSES = frozenset(("pending", "open", "partially_filled"))
+
 
 def load_config(config_file="config.yaml"):
     """
-    加载配置文件
-    
+    加载配置文件（带 mtime 缓存）
+
+    解析结果以 pickle 缓存在 ~/.cache/dd-strategy 下；配置文件未修改时
+    直接反序列化缓存，跳过 YAML 解析（热重启场景下明显更快）。
+
     Args:
         config_file: 配置文件路径，可以是相对路径或绝对路径
-    
+
     Returns:
         dict: 配置字典
     """
@@ -40,13 +60,32 @@ def load_config(config_file="config.yaml"):
         config_path = os.path.join(current_dir, config_file)
     else:
         config_path = config_file
-    
+
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"配置文件不存在: {config_path}")
-    
+
+    # 缓存键：配置文件绝对路径 + mtime
+    mtime = os.path.getmtime(config_path)
+    path_key = hashlib.md5(os.path.abspath(config_path).encode('utf-8')).hexdigest()[:12]
+    cache_path = os.path.join(_CONFIG_CACHE_DIR, f"{path_key}.{int(mtime * 1000)}.pkl")
+
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+
     with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
-    
+        config = yaml.load(f, Loader=_YamlLoader)
+
+    # 写回缓存（失败不影响主流程）
+    try:
+        os.makedirs(_CONFIG_CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
     return config
 
 
@@ -128,7 +167,7 @@ def get_pending_orders_arrays(adapter, symbol):
         
         for order in open_orders:
             # 只处理未成交的订单（状态为 pending, open, partially_filled）
-            if order.status in ["pending", "open", "partially_filled"]:
+            if order.status in _OPEN_STATUSES:
                 if order.price is not None:
                     price = int(float(order.price))
                     try:
@@ -136,13 +175,13 @@ def get_pending_orders_arrays(adapter, symbol):
                     except (ValueError, TypeError):
                         continue  # 跳过无效的订单ID
                     
-                    if order.side in ["buy", "long"]:
+                    if order.side in _BUY_ALIASES:
                         if price not in long_prices:
                             long_prices.append(price)
                         if price not in long_price_to_ids:
                             long_price_to_ids[price] = []
                         long_price_to_ids[price].append(order_id)
-                    elif order.side in ["sell", "short"]:
+                    elif order.side in _SELL_ALIASES:
                         if price not in short_prices:
                             short_prices.append(price)
                         if price not in short_price_to_ids:
@@ -174,7 +213,7 @@ def cancel_stale_order_ids(adapter, symbol, stale_seconds=5, cancel_probability=
         
         for order in open_orders:
             # 只处理未成交的订单
-            if order.status in ["pending", "open", "partially_filled"]:
+            if order.status in _OPEN_STATUSES:
                 if order.created_at:
                     # 计算未成交时间（毫秒）
                     elapsed_time = current_time - order.created_at